@@ -3,6 +3,7 @@ from tkinter import ttk, filedialog, messagebox, scrolledtext
 import xml.etree.ElementTree as ET
 import json
 import os
+from collections import deque
 
 # Clase que representa un estado en un autómata
 class State:
@@ -69,7 +70,7 @@ class AFD:
     # Convierte el AFD a un formato de diccionario para serialización
     def to_afd_format(self):
         data = {
-            "alphabet": list(self.alphabet),
+            "alphabet": sorted(self.alphabet),
             "states": [state.name for state in self.states],
             "initial_state": self.initial_state.name if self.initial_state else "",
             "final_states": [state.name for state in self.final_states],
@@ -191,32 +192,69 @@ class NFA:
     # Convierte un NFA a un DFA usando el algoritmo de subconjuntos
     def to_dfa(self):
         dfa = AFD()  # Crea un nuevo DFA
-        initial_closure = self.lambda_closure({self.initial_state})  # Clausura lambda del estado inicial
-        dfa_state_map = {frozenset(initial_closure): dfa.add_state('q0', is_initial=True)}  # Mapa de estados
-        stack = [initial_closure]  # Pila para procesar los estados
+        if self.initial_state is None:
+            dfa.add_state('q0', is_initial=True)  # Sin estado inicial: DFA con un único estado
+            return dfa
 
-        while stack:
-            current_states = stack.pop()  # Toma un conjunto de estados de la pila
-            current_dfa_state = dfa_state_map[frozenset(current_states)]  # Estado correspondiente en el DFA
-
-            for symbol in self.alphabet:
-                next_states = set()  # Estados destino para el símbolo actual
-                for state in current_states:
-                    key = (state, symbol)
-                    if key in self.transitions:
-                        next_states.update(self.transitions[key])  # Añade los estados destino
-                next_closure = self.lambda_closure(next_states)  # Calcula la clausura lambda
-
-                if not next_closure:
+        index = {state: i for i, state in enumerate(self.states)}  # Índice de cada estado (bit del subconjunto)
+        symbols = sorted(self.alphabet)  # Orden fijo de símbolos para que los nombres sean reproducibles
+
+        # Precalcula la clausura lambda de cada estado como máscara de bits
+        closure_mask = []
+        for state in self.states:
+            mask = 0
+            for reached in self.lambda_closure({state}):
+                mask |= 1 << index[reached]
+            closure_mask.append(mask)
+
+        # Para cada estado y símbolo: clausura lambda de los destinos, como máscara de bits
+        move_mask = []
+        for state in self.states:
+            moves = {}
+            for symbol in symbols:
+                mask = 0
+                for next_state in self.transitions.get((state, symbol), ()):
+                    mask |= closure_mask[index[next_state]]
+                if mask:
+                    moves[symbol] = mask
+            move_mask.append(moves)
+
+        final_mask = 0  # Máscara de los estados finales
+        for state in self.final_states:
+            final_mask |= 1 << index[state]
+
+        initial_mask = closure_mask[index[self.initial_state]]  # Clausura lambda del estado inicial
+        dfa_state_map = {initial_mask: dfa.add_state('q0', is_initial=True, is_final=bool(initial_mask & final_mask))}  # Mapa de estados
+        queue = deque([initial_mask])  # Cola (BFS) para procesar los estados en orden determinista
+
+        while queue:
+            current_mask = queue.popleft()  # Toma un conjunto de estados de la cola
+            current_dfa_state = dfa_state_map[current_mask]  # Estado correspondiente en el DFA
+
+            # Lista de índices de los estados del subconjunto
+            members = []
+            remaining = current_mask
+            while remaining:
+                low_bit = remaining & -remaining
+                members.append(low_bit.bit_length() - 1)
+                remaining ^= low_bit
+
+            for symbol in symbols:
+                next_mask = 0  # Estados destino (ya con clausura lambda) para el símbolo actual
+                for i in members:
+                    next_mask |= move_mask[i].get(symbol, 0)
+
+                if not next_mask:
                     continue  # Si no hay estados destino, continúa
 
-                if frozenset(next_closure) not in dfa_state_map:
+                next_dfa_state = dfa_state_map.get(next_mask)
+                if next_dfa_state is None:
                     new_state_name = f'q{len(dfa_state_map)}'  # Nombre del nuevo estado
-                    is_final = any(state in self.final_states for state in next_closure)  # Es estado final?
-                    dfa_state_map[frozenset(next_closure)] = dfa.add_state(new_state_name, is_final=is_final)  # Añade el estado
-                    stack.append(next_closure)  # Añade el conjunto de estados a la pila
+                    next_dfa_state = dfa.add_state(new_state_name, is_final=bool(next_mask & final_mask))  # Añade el estado
+                    dfa_state_map[next_mask] = next_dfa_state
+                    queue.append(next_mask)  # Añade el conjunto de estados a la cola
 
-                dfa.add_transition(current_dfa_state, symbol, dfa_state_map[frozenset(next_closure)])  # Añade la transición
+                dfa.add_transition(current_dfa_state, symbol, next_dfa_state)  # Añade la transición
 
         return dfa  # Devuelve el DFA resultante
 